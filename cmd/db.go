@@ -6,7 +6,6 @@ import (
 	"log/slog"
 	"strconv"
 
-	"github.com/charmbracelet/lipgloss"
 	"github.com/spf13/cobra"
 
 	"github.com/helmcode/finops-cli/internal/store"
@@ -86,11 +85,6 @@ func runDBStats(cmd *cobra.Command, args []string) error {
 		retention = retVal
 	}
 
-	// Style output
-	headerStyle := lipgloss.NewStyle().Bold(true).Foreground(lipgloss.Color("12"))
-	labelStyle := lipgloss.NewStyle().Width(20)
-	valueStyle := lipgloss.NewStyle().Foreground(lipgloss.Color("10"))
-
 	fmt.Println(headerStyle.Render("Database Statistics"))
 	fmt.Println()
 	fmt.Printf("%s %s\n", labelStyle.Render("Size:"), valueStyle.Render(formatBytes(dbSize)))
@@ -140,7 +134,6 @@ func runDBPrune(cmd *cobra.Command, args []string) error {
 		return fmt.Errorf("pruning records: %w", err)
 	}
 
-	successStyle := lipgloss.NewStyle().Foreground(lipgloss.Color("10"))
 	fmt.Println(successStyle.Render(fmt.Sprintf("Retention set to %d months. Pruned %d old records.", retentionMonths, deleted)))
 
 	return nil
@@ -7,6 +7,7 @@ import (
 	"log/slog"
 	"os"
 	"path/filepath"
+	"sort"
 	"time"
 
 	"github.com/spf13/cobra"
@@ -151,13 +152,52 @@ func runReportSummary(cmd *cobra.Command, args []string) error {
 	}
 
 	dr := defaultDateRange()
+	ctx := context.Background()
+
+	// Load resources and account/service/region costs once and derive the
+	// per-region and per-account breakdowns from them, instead of issuing
+	// separate queries for every region and account.
+	costRows, err := s.Queries.GetCostByAccountAndService(ctx, store.GetCostByAccountAndServiceParams{
+		Provider:    "aws",
+		PeriodStart: dr.Start,
+		PeriodEnd:   dr.End,
+	})
+	if err != nil {
+		return fmt.Errorf("getting cost data: %w", err)
+	}
+
+	path := outputPath("summary")
+
+	// The CSV export is just the cost rows; skip building the summary,
+	// breakdowns, trend and commitments that only the other formats render.
+	if reportOutput == "csv" {
+		if err := report.GenerateSummaryCSV(path, costRows); err != nil {
+			return err
+		}
+		finalizeReport(path)
+		return nil
+	}
+
 	summaryData, err := analysis.GenerateSummary(s.Queries, "aws", dr)
 	if err != nil {
 		return fmt.Errorf("generating summary: %w", err)
 	}
 
-	ctx := context.Background()
-	resourceCount, _ := s.Queries.CountResourcesByProvider(ctx, "aws")
+	resourcesByRegion := make(map[string][]store.Resource)
+	allResources, err := s.Queries.GetResourcesByProvider(ctx, "aws")
+	if err != nil {
+		slog.Debug("could not load resources for summary", "error", err)
+	}
+	for _, r := range allResources {
+		if r.Region.Valid {
+			resourcesByRegion[r.Region.String] = append(resourcesByRegion[r.Region.String], r)
+		}
+	}
+	resourceCount := int64(len(allResources))
+
+	costsByRegion := sumCostByService(costRows, func(row store.GetCostByAccountAndServiceRow) (string, bool) {
+		return row.Region.String, row.Region.Valid
+	})
 
 	// Build region details with associated resources and service cost breakdown
 	var regionDetails []report.RegionDetail
@@ -168,37 +208,19 @@ func runReportSummary(cmd *cobra.Command, args []string) error {
 			Currency:    rc.Currency,
 		}
 		if rc.Region != "" {
-			resources, err := s.Queries.GetResourcesByRegion(ctx, store.GetResourcesByRegionParams{
-				Provider: "aws",
-				Region:   sql.NullString{String: rc.Region, Valid: true},
-			})
-			if err == nil {
-				rd.Resources = resources
-			}
+			rd.Resources = resourcesByRegion[rc.Region]
 		}
 		// Always get service cost breakdown per region
 		regionName := rc.Region
 		if regionName == "" {
 			regionName = "NoRegion"
 		}
-		serviceCosts, err := s.Queries.GetCostByServiceForRegion(ctx, store.GetCostByServiceForRegionParams{
-			Provider:    "aws",
-			Region:      sql.NullString{String: regionName, Valid: true},
-			PeriodStart: dr.Start,
-			PeriodEnd:   dr.End,
-		})
-		if err == nil {
-			for _, sc := range serviceCosts {
-				amount := 0.0
-				if sc.TotalAmount.Valid {
-					amount = sc.TotalAmount.Float64
-				}
-				if amount > 0 {
-					rd.ServiceCosts = append(rd.ServiceCosts, report.RegionServiceCost{
-						Service: sc.Service,
-						Amount:  amount,
-					})
-				}
+		for _, sc := range costsByRegion[regionName] {
+			if sc.amount > 0 {
+				rd.ServiceCosts = append(rd.ServiceCosts, report.RegionServiceCost{
+					Service: sc.service,
+					Amount:  sc.amount,
+				})
 			}
 		}
 		regionDetails = append(regionDetails, rd)
@@ -215,6 +237,9 @@ func runReportSummary(cmd *cobra.Command, args []string) error {
 	}
 
 	// Build account details with top services per account
+	costsByAccount := sumCostByService(costRows, func(row store.GetCostByAccountAndServiceRow) (string, bool) {
+		return row.AccountID, true
+	})
 	var accountDetails []report.AccountDetail
 	for _, acct := range summaryData.CostByAccount {
 		ad := report.AccountDetail{
@@ -223,24 +248,16 @@ func runReportSummary(cmd *cobra.Command, args []string) error {
 			Currency:      acct.Currency,
 			ResourceCount: acct.ResourceCount,
 		}
-		topSvcs, err := s.Queries.GetTopServicesByAccount(ctx, store.GetTopServicesByAccountParams{
-			Provider:    "aws",
-			AccountID:   acct.AccountID,
-			PeriodStart: dr.Start,
-			PeriodEnd:   dr.End,
-		})
-		if err == nil {
-			for _, svc := range topSvcs {
-				amount := 0.0
-				if svc.TotalAmount.Valid {
-					amount = svc.TotalAmount.Float64
-				}
-				if amount > 0 {
-					ad.TopServices = append(ad.TopServices, report.AccountServiceCost{
-						Service: svc.Service,
-						Amount:  amount,
-					})
-				}
+		topSvcs := costsByAccount[acct.AccountID]
+		if len(topSvcs) > accountTopServicesLimit {
+			topSvcs = topSvcs[:accountTopServicesLimit]
+		}
+		for _, svc := range topSvcs {
+			if svc.amount > 0 {
+				ad.TopServices = append(ad.TopServices, report.AccountServiceCost{
+					Service: svc.service,
+					Amount:  svc.amount,
+				})
 			}
 		}
 		accountDetails = append(accountDetails, ad)
@@ -261,24 +278,11 @@ func runReportSummary(cmd *cobra.Command, args []string) error {
 		CommitmentOverview: commitmentOverview,
 	}
 
-	path := outputPath("summary")
 	switch reportOutput {
 	case "json":
 		if err := report.GenerateSummaryJSON(path, reportData); err != nil {
 			return err
 		}
-	case "csv":
-		csvRows, err := s.Queries.GetCostByAccountAndService(ctx, store.GetCostByAccountAndServiceParams{
-			Provider:    "aws",
-			PeriodStart: dr.Start,
-			PeriodEnd:   dr.End,
-		})
-		if err != nil {
-			return fmt.Errorf("getting cost data for CSV: %w", err)
-		}
-		if err := report.GenerateSummaryCSV(path, csvRows); err != nil {
-			return err
-		}
 	case "pdf":
 		htmlPath := path + ".html"
 		if err := report.GenerateHTML("summary", htmlPath, reportData); err != nil {
@@ -298,6 +302,53 @@ func runReportSummary(cmd *cobra.Command, args []string) error {
 	return nil
 }
 
+// accountTopServicesLimit is the number of services listed per account in
+// the summary report.
+const accountTopServicesLimit = 5
+
+// serviceCost is the aggregated cost of a service within a group (region
+// or account).
+type serviceCost struct {
+	service string
+	amount  float64
+}
+
+// sumCostByService aggregates cost rows into per-group service totals,
+// each group sorted by descending amount. groupOf returns the group a row
+// belongs to, or false to skip the row.
+func sumCostByService(rows []store.GetCostByAccountAndServiceRow, groupOf func(store.GetCostByAccountAndServiceRow) (string, bool)) map[string][]serviceCost {
+	type groupService struct {
+		group   string
+		service string
+	}
+
+	index := make(map[groupService]int)
+	groups := make(map[string][]serviceCost)
+	for _, row := range rows {
+		group, ok := groupOf(row)
+		if !ok {
+			continue
+		}
+		key := groupService{group: group, service: row.Service}
+		i, seen := index[key]
+		if !seen {
+			i = len(groups[group])
+			index[key] = i
+			groups[group] = append(groups[group], serviceCost{service: row.Service})
+		}
+		if row.TotalAmount.Valid {
+			groups[group][i].amount += row.TotalAmount.Float64
+		}
+	}
+
+	for _, costs := range groups {
+		sort.SliceStable(costs, func(a, b int) bool {
+			return costs[a].amount > costs[b].amount
+		})
+	}
+	return groups
+}
+
 func runReportTopServices(cmd *cobra.Command, args []string) error {
 	s, err := openStore()
 	if err != nil {
@@ -4,11 +4,21 @@ import (
 	"log/slog"
 	"os"
 
+	"github.com/charmbracelet/lipgloss"
 	"github.com/spf13/cobra"
 )
 
 var verbose bool
 
+// Terminal styles shared by command output.
+var (
+	headerStyle  = lipgloss.NewStyle().Bold(true).Foreground(lipgloss.Color("12"))
+	labelStyle   = lipgloss.NewStyle().Width(20)
+	valueStyle   = lipgloss.NewStyle().Foreground(lipgloss.Color("10"))
+	successStyle = lipgloss.NewStyle().Foreground(lipgloss.Color("10"))
+	warnStyle    = lipgloss.NewStyle().Foreground(lipgloss.Color("11"))
+)
+
 var rootCmd = &cobra.Command{
 	Use:   "finops",
 	Short: "FinOps CLI - Cloud cost analysis and optimization tool",
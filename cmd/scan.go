@@ -7,10 +7,10 @@ import (
 	"log/slog"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/briandowns/spinner"
-	"github.com/charmbracelet/lipgloss"
 	"github.com/spf13/cobra"
 
 	providerpkg "github.com/helmcode/finops-cli/internal/provider"
@@ -25,8 +25,16 @@ var (
 	scanFrom     string
 	scanTo       string
 	scanAccount  string
+	scanRefresh  bool
 )
 
+// costCacheTTL is how long cost data from a completed sync is reused before
+// Cost Explorer is queried again for the same account and period.
+const costCacheTTL = 4 * time.Hour
+
+// discoveryConcurrency bounds the number of in-flight resource discovery calls.
+const discoveryConcurrency = 8
+
 var scanCmd = &cobra.Command{
 	Use:   "scan",
 	Short: "Download costs and discover resources from cloud providers",
@@ -40,6 +48,7 @@ func init() {
 	scanCmd.Flags().StringVar(&scanFrom, "from", "", "Start date (YYYY-MM-DD)")
 	scanCmd.Flags().StringVar(&scanTo, "to", "", "End date (YYYY-MM-DD)")
 	scanCmd.Flags().StringVar(&scanAccount, "account", "", "Filter accounts (comma-separated IDs)")
+	scanCmd.Flags().BoolVar(&scanRefresh, "refresh", false, "Re-fetch costs even if a recent sync is cached locally")
 
 	_ = scanCmd.MarkFlagRequired("provider")
 
@@ -126,6 +135,7 @@ func runScan(cmd *cobra.Command, args []string) error {
 
 	// Process each account
 	totalCostRecords := 0
+	totalReusedRecords := 0
 	totalResources := 0
 	accountsProcessed := 0
 	accountsSkipped := 0
@@ -150,52 +160,68 @@ func runScan(cmd *cobra.Command, args []string) error {
 			slog.Warn("failed to create sync history", "account", acct.ID, "error", err)
 		}
 
+		// Reuse cost data from a recent sync of the same period, if any
+		var costRecords []providerpkg.CostRecord
+		cached := false
+		if !scanRefresh {
+			costRecords, cached = loadCachedCostRecords(ctx, s, acct.ID, start, end)
+		}
+
 		// Fetch costs
-		groupBy := []string{"SERVICE", "REGION"}
-		costRecords, err := provider.FetchCosts(providerpkg.CostParams{
-			AccountID:   acct.ID,
-			Start:       start,
-			End:         end,
-			Granularity: "MONTHLY",
-			GroupBy:     groupBy,
-		})
-		if err != nil {
-			sp.Stop()
-			if awsprovider.IsAccessDenied(err) {
-				slog.Warn("access denied, skipping account", "account", acct.ID)
-				accountsSkipped++
-				skippedAccounts = append(skippedAccounts, acct.ID)
-				continue
+		if !cached {
+			groupBy := []string{"SERVICE", "REGION"}
+			costRecords, err = provider.FetchCosts(providerpkg.CostParams{
+				AccountID:   acct.ID,
+				Start:       start,
+				End:         end,
+				Granularity: "MONTHLY",
+				GroupBy:     groupBy,
+			})
+			if err != nil {
+				sp.Stop()
+				if awsprovider.IsAccessDenied(err) {
+					slog.Warn("access denied, skipping account", "account", acct.ID)
+					accountsSkipped++
+					skippedAccounts = append(skippedAccounts, acct.ID)
+					continue
+				}
+				return fmt.Errorf("fetching costs for account %s: %w", acct.ID, err)
 			}
-			return fmt.Errorf("fetching costs for account %s: %w", acct.ID, err)
 		}
 
-		// Store cost records
+		// Store cost records (cached records are already in the database)
 		costCount := 0
-		for _, record := range costRecords {
-			err := s.Queries.UpsertCostRecord(ctx, store.UpsertCostRecordParams{
-				Provider:    record.Provider,
-				AccountID:   record.AccountID,
-				Service:     record.Service,
-				Region:      sql.NullString{String: record.Region, Valid: record.Region != ""},
-				PeriodStart: record.PeriodStart,
-				PeriodEnd:   record.PeriodEnd,
-				Granularity: record.Granularity,
-				Amount:      record.Amount,
-				Currency:    record.Currency,
-				SyncedAt:    time.Now().UTC().Format(time.RFC3339),
-			})
-			if err != nil {
-				slog.Warn("failed to store cost record", "error", err)
-				continue
+		reusedCount := 0
+		if cached {
+			reusedCount = len(costRecords)
+		} else {
+			syncedAt := time.Now().UTC().Format(time.RFC3339)
+			for _, record := range costRecords {
+				err := s.Queries.UpsertCostRecord(ctx, store.UpsertCostRecordParams{
+					Provider:    record.Provider,
+					AccountID:   record.AccountID,
+					Service:     record.Service,
+					Region:      sql.NullString{String: record.Region, Valid: record.Region != ""},
+					PeriodStart: record.PeriodStart,
+					PeriodEnd:   record.PeriodEnd,
+					Granularity: record.Granularity,
+					Amount:      record.Amount,
+					Currency:    record.Currency,
+					SyncedAt:    syncedAt,
+				})
+				if err != nil {
+					slog.Warn("failed to store cost record", "error", err)
+					continue
+				}
+				costCount++
 			}
-			costCount++
 		}
 
 		// Discover resources for each service+region pair with spend
 		sp.Suffix = fmt.Sprintf(" Discovering resources for account %s...", acct.ID)
 		resourceCount := 0
-		discoveredPairs := make(map[string]bool)
+		discoveredPairs := make(map[discoveryPair]bool)
+		var pairs []discoveryPair
 
 		for _, record := range costRecords {
 			// Skip zero-cost records to avoid unnecessary API calls
@@ -214,19 +240,23 @@ func runScan(cmd *cobra.Command, args []string) error {
 			if region == "" || region == "NoRegion" {
 				continue
 			}
-			pairKey := record.Service + "|" + region
-			if discoveredPairs[pairKey] {
+			pair := discoveryPair{service: record.Service, region: region}
+			if discoveredPairs[pair] {
 				continue
 			}
-			discoveredPairs[pairKey] = true
+			discoveredPairs[pair] = true
+			pairs = append(pairs, pair)
+		}
 
-			resources, err := provider.DiscoverResources(record.Service, region)
-			if err != nil {
-				slog.Debug("resource discovery failed", "service", record.Service, "error", err)
+		results := discoverResourcesConcurrently(provider, pairs)
+		discoveredAt := time.Now().UTC().Format(time.RFC3339)
+		for i, result := range results {
+			if result.err != nil {
+				slog.Debug("resource discovery failed", "service", pairs[i].service, "error", result.err)
 				continue
 			}
 
-			for _, res := range resources {
+			for _, res := range result.resources {
 				err := s.Queries.UpsertResource(ctx, store.UpsertResourceParams{
 					Provider:     res.Provider,
 					AccountID:    res.AccountID,
@@ -238,7 +268,7 @@ func runScan(cmd *cobra.Command, args []string) error {
 					Spec:         sql.NullString{String: res.Spec, Valid: res.Spec != ""},
 					Tags:         sql.NullString{String: res.Tags, Valid: res.Tags != ""},
 					State:        sql.NullString{String: res.State, Valid: res.State != ""},
-					DiscoveredAt: time.Now().UTC().Format(time.RFC3339),
+					DiscoveredAt: discoveredAt,
 				})
 				if err != nil {
 					slog.Debug("failed to store resource", "resource", res.ResourceID, "error", err)
@@ -250,7 +280,8 @@ func runScan(cmd *cobra.Command, args []string) error {
 
 		sp.Stop()
 
-		// Update sync history
+		// Update sync history. cost_records counts only freshly fetched records,
+		// so a run served from cache records 0 and never extends the cache TTL.
 		if syncID > 0 {
 			_ = s.Queries.UpdateSyncHistoryCompleted(ctx, store.UpdateSyncHistoryCompletedParams{
 				CostRecords:    sql.NullInt64{Int64: int64(costCount), Valid: true},
@@ -261,11 +292,16 @@ func runScan(cmd *cobra.Command, args []string) error {
 		}
 
 		totalCostRecords += costCount
+		totalReusedRecords += reusedCount
 		totalResources += resourceCount
 		accountsProcessed++
 
 		if verbose {
-			fmt.Printf("  Account %s: %d cost records, %d resources\n", acct.ID, costCount, resourceCount)
+			if cached {
+				fmt.Printf("  Account %s: %d cost records reused from cache, %d resources\n", acct.ID, reusedCount, resourceCount)
+			} else {
+				fmt.Printf("  Account %s: %d cost records, %d resources\n", acct.ID, costCount, resourceCount)
+			}
 		}
 	}
 
@@ -328,11 +364,98 @@ func runScan(cmd *cobra.Command, args []string) error {
 	}
 
 	// Print summary
-	printScanSummary(accountsProcessed, accountsSkipped, totalCostRecords, totalResources, skippedAccounts)
+	printScanSummary(accountsProcessed, accountsSkipped, totalCostRecords, totalReusedRecords, totalResources, skippedAccounts)
 
 	return nil
 }
 
+// discoveryPair is a service+region combination to discover resources for.
+type discoveryPair struct {
+	service string
+	region  string
+}
+
+// discoveryResult holds the outcome of discovering a single discoveryPair.
+type discoveryResult struct {
+	resources []providerpkg.Resource
+	err       error
+}
+
+// discoverResourcesConcurrently runs resource discovery for every pair using
+// a bounded pool of goroutines. Discovery is dominated by API round trips, so
+// overlapping them cuts wall time roughly by the pool size. Results are
+// returned in the same order as pairs.
+func discoverResourcesConcurrently(p providerpkg.Provider, pairs []discoveryPair) []discoveryResult {
+	results := make([]discoveryResult, len(pairs))
+	sem := make(chan struct{}, discoveryConcurrency)
+	var wg sync.WaitGroup
+
+	for i, pair := range pairs {
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(i int, pair discoveryPair) {
+			defer wg.Done()
+			defer func() { <-sem }()
+			resources, err := p.DiscoverResources(pair.service, pair.region)
+			results[i] = discoveryResult{resources: resources, err: err}
+		}(i, pair)
+	}
+
+	wg.Wait()
+	return results
+}
+
+// loadCachedCostRecords returns the stored cost records for an account when a
+// sync of the same period completed less than costCacheTTL ago. Cost Explorer
+// is slow and billed per request, so back-to-back scans reuse local data.
+func loadCachedCostRecords(ctx context.Context, s *store.Store, accountID string, start, end time.Time) ([]providerpkg.CostRecord, bool) {
+	periodStart := start.Format("2006-01-02")
+	periodEnd := end.Format("2006-01-02")
+
+	lastSync, err := s.Queries.GetLatestCompletedSyncForPeriod(ctx, store.GetLatestCompletedSyncForPeriodParams{
+		Provider:    "aws",
+		AccountID:   accountID,
+		PeriodStart: periodStart,
+		PeriodEnd:   periodEnd,
+	})
+	if err != nil || !lastSync.CompletedAt.Valid {
+		return nil, false
+	}
+
+	completedAt, err := time.Parse(time.RFC3339, lastSync.CompletedAt.String)
+	if err != nil || time.Since(completedAt) > costCacheTTL {
+		return nil, false
+	}
+
+	rows, err := s.Queries.GetCostRecordsByAccountAndDateRange(ctx, store.GetCostRecordsByAccountAndDateRangeParams{
+		Provider:    "aws",
+		AccountID:   accountID,
+		PeriodStart: periodStart,
+		PeriodEnd:   periodEnd,
+	})
+	if err != nil || len(rows) == 0 {
+		return nil, false
+	}
+
+	records := make([]providerpkg.CostRecord, 0, len(rows))
+	for _, row := range rows {
+		records = append(records, providerpkg.CostRecord{
+			Provider:    row.Provider,
+			AccountID:   row.AccountID,
+			Service:     row.Service,
+			Region:      row.Region.String,
+			PeriodStart: row.PeriodStart,
+			PeriodEnd:   row.PeriodEnd,
+			Granularity: row.Granularity,
+			Amount:      row.Amount,
+			Currency:    row.Currency,
+		})
+	}
+
+	slog.Info("using cached cost data", "account", accountID, "synced_at", lastSync.CompletedAt.String, "records", len(records))
+	return records, true
+}
+
 func determineDateRange() (time.Time, time.Time, error) {
 	now := time.Now()
 
@@ -362,11 +485,7 @@ func determineDateRange() (time.Time, time.Time, error) {
 	return start, end, nil
 }
 
-func printScanSummary(processed, skipped, costRecords, resources int, skippedAccounts []string) {
-	headerStyle := lipgloss.NewStyle().Bold(true).Foreground(lipgloss.Color("12"))
-	successStyle := lipgloss.NewStyle().Foreground(lipgloss.Color("10"))
-	warnStyle := lipgloss.NewStyle().Foreground(lipgloss.Color("11"))
-
+func printScanSummary(processed, skipped, costRecords, reusedRecords, resources int, skippedAccounts []string) {
 	fmt.Println()
 	fmt.Println(headerStyle.Render("Scan completed"))
 	fmt.Printf("%s %s\n",
@@ -378,8 +497,12 @@ func printScanSummary(processed, skipped, costRecords, resources int, skippedAcc
 			return ""
 		}(),
 	)
+	costSummary := fmt.Sprintf("%d synced", costRecords)
+	if reusedRecords > 0 {
+		costSummary += fmt.Sprintf(", %d reused from cache", reusedRecords)
+	}
 	fmt.Printf("Cost records: %s | Resources: %s\n",
-		successStyle.Render(fmt.Sprintf("%d synced", costRecords)),
+		successStyle.Render(costSummary),
 		successStyle.Render(fmt.Sprintf("%d discovered", resources)),
 	)
 
@@ -0,0 +1,88 @@
+package cmd
+
+import (
+	"context"
+	"database/sql"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	"github.com/helmcode/finops-cli/internal/store"
+)
+
+func TestLoadCachedCostRecords(t *testing.T) {
+	start := time.Date(2026, 1, 1, 0, 0, 0, 0, time.UTC)
+	end := time.Date(2026, 3, 1, 0, 0, 0, 0, time.UTC)
+	account := "123456789012"
+
+	setup := func(t *testing.T) *store.Store {
+		t.Helper()
+		s, err := store.OpenAt(filepath.Join(t.TempDir(), "test.db"))
+		require.NoError(t, err)
+		t.Cleanup(func() { s.Close() })
+
+		err = s.Queries.UpsertCostRecord(context.Background(), store.UpsertCostRecordParams{
+			Provider:    "aws",
+			AccountID:   account,
+			Service:     "Amazon EC2",
+			Region:      sql.NullString{String: "us-east-1", Valid: true},
+			PeriodStart: "2026-01-01",
+			PeriodEnd:   "2026-02-01",
+			Granularity: "MONTHLY",
+			Amount:      1000,
+			Currency:    "USD",
+			SyncedAt:    "2026-03-18T00:00:00Z",
+		})
+		require.NoError(t, err)
+		return s
+	}
+
+	recordSync := func(t *testing.T, s *store.Store, completedAgo time.Duration, costRecords int64) {
+		t.Helper()
+		_, err := s.Queries.InsertSyncHistory(context.Background(), store.InsertSyncHistoryParams{
+			Provider:    "aws",
+			AccountID:   account,
+			PeriodStart: "2026-01-01",
+			PeriodEnd:   "2026-03-01",
+			CostRecords: sql.NullInt64{Int64: costRecords, Valid: true},
+			StartedAt:   time.Now().Add(-completedAgo).UTC().Format(time.RFC3339),
+			CompletedAt: sql.NullString{String: time.Now().Add(-completedAgo).UTC().Format(time.RFC3339), Valid: true},
+		})
+		require.NoError(t, err)
+	}
+
+	t.Run("no previous sync", func(t *testing.T) {
+		s := setup(t)
+		records, ok := loadCachedCostRecords(context.Background(), s, account, start, end)
+		assert.False(t, ok)
+		assert.Nil(t, records)
+	})
+
+	t.Run("recent sync is reused", func(t *testing.T) {
+		s := setup(t)
+		recordSync(t, s, time.Hour, 1)
+		records, ok := loadCachedCostRecords(context.Background(), s, account, start, end)
+		require.True(t, ok)
+		require.Len(t, records, 1)
+		assert.Equal(t, "Amazon EC2", records[0].Service)
+		assert.Equal(t, "us-east-1", records[0].Region)
+	})
+
+	t.Run("sync older than TTL is refetched", func(t *testing.T) {
+		s := setup(t)
+		recordSync(t, s, costCacheTTL+time.Hour, 1)
+		_, ok := loadCachedCostRecords(context.Background(), s, account, start, end)
+		assert.False(t, ok)
+	})
+
+	t.Run("cached runs do not extend the TTL", func(t *testing.T) {
+		s := setup(t)
+		recordSync(t, s, costCacheTTL+time.Hour, 1)
+		recordSync(t, s, time.Minute, 0)
+		_, ok := loadCachedCostRecords(context.Background(), s, account, start, end)
+		assert.False(t, ok)
+	})
+}
@@ -68,6 +68,13 @@ WHERE provider = ? AND period_start >= ? AND period_end <= ?
 GROUP BY account_id, period_start, currency
 ORDER BY account_id, period_start ASC;
 
+-- name: GetMonthlyCostByService :many
+SELECT service, period_start, SUM(amount) AS total_amount, currency
+FROM cost_records
+WHERE provider = ?
+GROUP BY service, period_start, currency
+ORDER BY service, period_start ASC;
+
 -- name: CountCostRecords :one
 SELECT COUNT(*) FROM cost_records;
 
@@ -14,6 +14,16 @@ WHERE provider = ? AND account_id = ?
 ORDER BY started_at DESC
 LIMIT 1;
 
+-- name: GetLatestCompletedSyncForPeriod :one
+-- cost_records holds only records fetched from the provider during that run;
+-- scans that reuse cached cost data store 0. Requiring cost_records > 0 keeps
+-- the cache TTL anchored to the last live fetch rather than the last scan.
+SELECT * FROM sync_history
+WHERE provider = ? AND account_id = ? AND period_start = ? AND period_end = ?
+  AND completed_at IS NOT NULL AND cost_records > 0
+ORDER BY completed_at DESC
+LIMIT 1;
+
 -- name: GetLatestSyncByProvider :one
 SELECT * FROM sync_history
 WHERE provider = ?
@@ -144,16 +144,43 @@ func TestComparePeriods(t *testing.T) {
 	assert.Greater(t, result.TotalPercent, 0.0)
 }
 
-func TestCalculateMean(t *testing.T) {
-	assert.Equal(t, 0.0, calculateMean(nil))
-	assert.Equal(t, 2.0, calculateMean([]float64{1, 2, 3}))
-	assert.Equal(t, 5.0, calculateMean([]float64{5}))
+func TestClassifySeverity(t *testing.T) {
+	tests := []struct {
+		absZ     float64
+		severity AnomalySeverity
+		ok       bool
+	}{
+		{1.9, "", false},
+		{2.0, SeverityLow, true},
+		{2.9, SeverityLow, true},
+		{3.0, SeverityMedium, true},
+		{3.9, SeverityMedium, true},
+		{4.0, SeverityHigh, true},
+		{10, SeverityHigh, true},
+	}
+
+	for _, tc := range tests {
+		severity, ok := classifySeverity(tc.absZ, 2.0)
+		assert.Equal(t, tc.ok, ok, "absZ=%v", tc.absZ)
+		assert.Equal(t, tc.severity, severity, "absZ=%v", tc.absZ)
+	}
 }
 
-func TestCalculateStdDev(t *testing.T) {
-	assert.Equal(t, 0.0, calculateStdDev(nil, 0))
-	assert.Equal(t, 0.0, calculateStdDev([]float64{5}, 5))
-	// stddev of [1, 2, 3] with mean 2 = sqrt(2/3) ≈ 0.8165
-	stddev := calculateStdDev([]float64{1, 2, 3}, 2)
-	assert.InDelta(t, 0.8165, stddev, 0.01)
+func TestMeanStdDev(t *testing.T) {
+	mean, stddev := meanStdDev(nil)
+	assert.Equal(t, 0.0, mean)
+	assert.Equal(t, 0.0, stddev)
+
+	mean, stddev = meanStdDev([]float64{5})
+	assert.Equal(t, 5.0, mean)
+	assert.Equal(t, 0.0, stddev)
+
+	// Population stddev of [1, 2, 3] with mean 2 = sqrt(2/3) ≈ 0.8165
+	mean, stddev = meanStdDev([]float64{1, 2, 3})
+	assert.InDelta(t, 2.0, mean, 1e-12)
+	assert.InDelta(t, 0.8165, stddev, 0.0001)
+
+	mean, stddev = meanStdDev([]float64{1200.5, 2450, 5000, 2380.25, 2410})
+	assert.InDelta(t, 2688.15, mean, 1e-9)
+	assert.InDelta(t, 1247.9293409, stddev, 1e-6)
 }
@@ -17,6 +17,17 @@ const (
 	SeverityHigh   AnomalySeverity = "high"
 )
 
+// severityCutoffs maps multiples of the detection threshold to a severity,
+// ordered from most to least severe.
+var severityCutoffs = [...]struct {
+	factor   float64
+	severity AnomalySeverity
+}{
+	{2, SeverityHigh},
+	{1.5, SeverityMedium},
+	{1, SeverityLow},
+}
+
 // AnomalyResult represents a detected cost anomaly.
 type AnomalyResult struct {
 	Period    string
@@ -32,39 +43,42 @@ type AnomalyResult struct {
 func DetectAnomalies(q *store.Queries, provider string, dr DateRange, threshold float64) ([]AnomalyResult, error) {
 	ctx := context.Background()
 
-	// Get all cost records by service
-	services, err := q.GetDistinctServices(ctx, provider)
+	// Load every service's monthly series in one query; rows arrive ordered
+	// by service, then period, so each service is a contiguous run.
+	rows, err := q.GetMonthlyCostByService(ctx, provider)
 	if err != nil {
-		return nil, fmt.Errorf("getting distinct services: %w", err)
+		return nil, fmt.Errorf("getting monthly cost by service: %w", err)
 	}
 
 	var anomalies []AnomalyResult
-
-	for _, service := range services {
-		rows, err := q.GetMonthlyCostTrendByService(ctx, store.GetMonthlyCostTrendByServiceParams{
-			Provider: provider,
-			Service:  service,
-		})
-		if err != nil {
-			return nil, fmt.Errorf("getting trend for %s: %w", service, err)
+	amounts := make([]float64, 0, len(rows))
+	periods := make([]string, 0, len(rows))
+
+	for start := 0; start < len(rows); {
+		service := rows[start].Service
+		end := start + 1
+		for end < len(rows) && rows[end].Service == service {
+			end++
 		}
 
-		if len(rows) < 3 {
-			continue // Need at least 3 data points for meaningful detection
-		}
-
-		amounts := make([]float64, len(rows))
-		periods := make([]string, len(rows))
-		for i, row := range rows {
-			if row.TotalAmount.Valid {
-				amounts[i] = row.TotalAmount.Float64
+		// Need at least 3 data points for meaningful detection
+		if end-start >= 3 {
+			amounts, periods = amounts[:0], periods[:0]
+			for _, row := range rows[start:end] {
+				amount := 0.0
+				if row.TotalAmount.Valid {
+					amount = row.TotalAmount.Float64
+				}
+				amounts = append(amounts, amount)
+				periods = append(periods, row.PeriodStart)
 			}
-			periods[i] = row.PeriodStart
+
+			// Calculate z-scores using moving average and standard deviation
+			detected := detectWithZScore(amounts, periods, service, threshold)
+			anomalies = append(anomalies, detected...)
 		}
 
-		// Calculate z-scores using moving average and standard deviation
-		detected := detectWithZScore(amounts, periods, service, threshold)
-		anomalies = append(anomalies, detected...)
+		start = end
 	}
 
 	return anomalies, nil
@@ -76,8 +90,7 @@ func detectWithZScore(amounts []float64, periods []string, service string, thres
 		return nil
 	}
 
-	mean := calculateMean(amounts)
-	stddev := calculateStdDev(amounts, mean)
+	mean, stddev := meanStdDev(amounts)
 
 	if stddev == 0 {
 		return nil // No variance, no anomalies
@@ -87,47 +100,47 @@ func detectWithZScore(amounts []float64, periods []string, service string, thres
 	for i, amount := range amounts {
 		zScore := (amount - mean) / stddev
 
-		if math.Abs(zScore) >= threshold {
-			severity := SeverityLow
-			if math.Abs(zScore) >= threshold*2 {
-				severity = SeverityHigh
-			} else if math.Abs(zScore) >= threshold*1.5 {
-				severity = SeverityMedium
-			}
-
-			results = append(results, AnomalyResult{
-				Period:    periods[i],
-				Service:   service,
-				Expected:  mean,
-				Actual:    amount,
-				Deviation: zScore,
-				Severity:  severity,
-			})
+		severity, ok := classifySeverity(math.Abs(zScore), threshold)
+		if !ok {
+			continue
 		}
+
+		results = append(results, AnomalyResult{
+			Period:    periods[i],
+			Service:   service,
+			Expected:  mean,
+			Actual:    amount,
+			Deviation: zScore,
+			Severity:  severity,
+		})
 	}
 
 	return results
 }
 
-func calculateMean(values []float64) float64 {
-	if len(values) == 0 {
-		return 0
-	}
-	sum := 0.0
-	for _, v := range values {
-		sum += v
+// classifySeverity returns the severity for an absolute z-score, or false if
+// it falls below threshold.
+func classifySeverity(absZ, threshold float64) (AnomalySeverity, bool) {
+	for _, c := range severityCutoffs {
+		if absZ >= threshold*c.factor {
+			return c.severity, true
+		}
 	}
-	return sum / float64(len(values))
+	return "", false
 }
 
-func calculateStdDev(values []float64, mean float64) float64 {
-	if len(values) < 2 {
-		return 0
+// meanStdDev returns the mean and population standard deviation of values in
+// a single pass (Welford's algorithm), avoiding a second walk over the series
+// while staying numerically stable for large cost amounts.
+func meanStdDev(values []float64) (mean, stddev float64) {
+	var m2 float64
+	for i, v := range values {
+		delta := v - mean
+		mean += delta / float64(i+1)
+		m2 += delta * (v - mean)
 	}
-	sumSquares := 0.0
-	for _, v := range values {
-		diff := v - mean
-		sumSquares += diff * diff
+	if len(values) < 2 {
+		return mean, 0
 	}
-	return math.Sqrt(sumSquares / float64(len(values)))
+	return mean, math.Sqrt(m2 / float64(len(values)))
 }
@@ -29,6 +29,12 @@ type CompareResult struct {
 	Currency        string
 }
 
+// periodAmounts holds a service's cost in the current and previous periods.
+type periodAmounts struct {
+	current  float64
+	previous float64
+}
+
 // ComparePeriods compares costs between two date ranges.
 func ComparePeriods(q *store.Queries, provider string, current, previous DateRange) (*CompareResult, error) {
 	ctx := context.Background()
@@ -43,7 +49,20 @@ func ComparePeriods(q *store.Queries, provider string, current, previous DateRan
 		return nil, fmt.Errorf("getting current period costs: %w", err)
 	}
 
-	currentByService := make(map[string]float64)
+	// Both periods accumulate into one entry per service; services keeps
+	// first-seen order so the deltas come out in a stable order.
+	byService := make(map[string]*periodAmounts, len(currentRows))
+	var services []string
+	entry := func(svc string) *periodAmounts {
+		e, ok := byService[svc]
+		if !ok {
+			e = &periodAmounts{}
+			byService[svc] = e
+			services = append(services, svc)
+		}
+		return e
+	}
+
 	totalCurrent := 0.0
 	currency := "USD"
 	for _, row := range currentRows {
@@ -51,7 +70,7 @@ func ComparePeriods(q *store.Queries, provider string, current, previous DateRan
 		if row.TotalAmount.Valid {
 			amount = row.TotalAmount.Float64
 		}
-		currentByService[row.Service] = amount
+		entry(row.Service).current = amount
 		totalCurrent += amount
 		currency = row.Currency
 	}
@@ -66,30 +85,21 @@ func ComparePeriods(q *store.Queries, provider string, current, previous DateRan
 		return nil, fmt.Errorf("getting previous period costs: %w", err)
 	}
 
-	previousByService := make(map[string]float64)
 	totalPrevious := 0.0
 	for _, row := range previousRows {
 		amount := 0.0
 		if row.TotalAmount.Valid {
 			amount = row.TotalAmount.Float64
 		}
-		previousByService[row.Service] = amount
+		entry(row.Service).previous = amount
 		totalPrevious += amount
 	}
 
 	// Build service deltas (union of both periods)
-	allServices := make(map[string]bool)
-	for svc := range currentByService {
-		allServices[svc] = true
-	}
-	for svc := range previousByService {
-		allServices[svc] = true
-	}
-
-	var deltas []ServiceDelta
-	for svc := range allServices {
-		cur := currentByService[svc]
-		prev := previousByService[svc]
+	deltas := make([]ServiceDelta, 0, len(services))
+	for _, svc := range services {
+		e := byService[svc]
+		cur, prev := e.current, e.previous
 		change := cur - prev
 		pctChange := 0.0
 		if prev != 0 {
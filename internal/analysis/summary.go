@@ -69,7 +69,7 @@ func GenerateSummary(q *store.Queries, provider string, dr DateRange) (*SummaryD
 		return nil, fmt.Errorf("getting costs by service: %w", err)
 	}
 
-	var topServices []ServiceCost
+	topServices := make([]ServiceCost, 0, len(serviceRows))
 	totalSpend := 0.0
 	currency := "USD"
 	for _, row := range serviceRows {
@@ -96,7 +96,7 @@ func GenerateSummary(q *store.Queries, provider string, dr DateRange) (*SummaryD
 		return nil, fmt.Errorf("getting costs by region: %w", err)
 	}
 
-	var costByRegion []RegionCost
+	costByRegion := make([]RegionCost, 0, len(regionRows))
 	for _, row := range regionRows {
 		region := ""
 		if row.Region.Valid {
@@ -119,7 +119,7 @@ func GenerateSummary(q *store.Queries, provider string, dr DateRange) (*SummaryD
 		return nil, fmt.Errorf("counting resources by service: %w", err)
 	}
 
-	var resourceCounts []ResourceCount
+	resourceCounts := make([]ResourceCount, 0, len(countRows))
 	for _, row := range countRows {
 		resourceCounts = append(resourceCounts, ResourceCount{
 			Service: row.Service,
@@ -142,12 +142,12 @@ func GenerateSummary(q *store.Queries, provider string, dr DateRange) (*SummaryD
 	if err != nil {
 		slog.Debug("could not get resource counts by account", "error", err)
 	}
-	accountResourceMap := make(map[string]int64)
+	accountResourceMap := make(map[string]int64, len(accountResourceRows))
 	for _, row := range accountResourceRows {
 		accountResourceMap[row.AccountID] = row.Count
 	}
 
-	var costByAccount []AccountCost
+	costByAccount := make([]AccountCost, 0, len(accountRows))
 	for _, row := range accountRows {
 		amount := 0.0
 		if row.TotalAmount.Valid {
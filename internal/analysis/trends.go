@@ -44,6 +44,7 @@ func GenerateTrend(q *store.Queries, provider, service string) (*TrendData, erro
 		if err != nil {
 			return nil, fmt.Errorf("getting trend by service: %w", err)
 		}
+		dataPoints = make([]MonthlyDataPoint, 0, len(rows))
 		for _, row := range rows {
 			amount := 0.0
 			if row.TotalAmount.Valid {
@@ -59,6 +60,7 @@ func GenerateTrend(q *store.Queries, provider, service string) (*TrendData, erro
 		if err != nil {
 			return nil, fmt.Errorf("getting overall trend: %w", err)
 		}
+		dataPoints = make([]MonthlyDataPoint, 0, len(rows))
 		for _, row := range rows {
 			amount := 0.0
 			if row.TotalAmount.Valid {
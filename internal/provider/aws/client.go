@@ -4,6 +4,7 @@ import (
 	"context"
 	"fmt"
 	"log/slog"
+	"sync"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
 	awsconfig "github.com/aws/aws-sdk-go-v2/config"
@@ -96,6 +97,12 @@ type AWSProvider struct {
 	ecacheClient  ElastiCacheAPI
 	cfClient      CloudFrontAPI
 	registry      *discovery.Registry
+
+	// mu guards registry and discoveryCache, which DiscoverResources
+	// may access from concurrent goroutines.
+	mu sync.Mutex
+	// discoveryCache memoizes DiscoverResources results per service+region.
+	discoveryCache map[discoveryKey][]provider.Resource
 }
 
 // Ensure AWSProvider implements provider.Provider at compile time.
@@ -8,6 +8,12 @@ import (
 	"github.com/helmcode/finops-cli/internal/provider/aws/discovery"
 )
 
+// discoveryKey identifies a memoized resource discovery call.
+type discoveryKey struct {
+	service string
+	region  string
+}
+
 // InitDiscoveryRegistry creates and populates the resource discovery registry
 // with all v1 adapters using the provider's AWS clients.
 func (p *AWSProvider) InitDiscoveryRegistry() *discovery.Registry {
@@ -40,17 +46,32 @@ func (p *AWSProvider) InitDiscoveryRegistry() *discovery.Registry {
 // DiscoverResources finds active resources for a given service in a region.
 // This delegates to the discovery registry which maps service names to
 // specific discovery adapters.
+//
+// Results are memoized per service+region: discovery always runs with the
+// caller's credentials, so repeated calls (e.g., once per scanned account)
+// would otherwise re-issue identical API requests. It is safe for
+// concurrent use.
 func (p *AWSProvider) DiscoverResources(service, region string) ([]provider.Resource, error) {
+	key := discoveryKey{service: service, region: region}
+
+	p.mu.Lock()
 	if p.registry == nil {
 		p.registry = p.InitDiscoveryRegistry()
 	}
-
 	discoverer := p.registry.Lookup(service)
+	cached, ok := p.discoveryCache[key]
+	p.mu.Unlock()
+
 	if discoverer == nil {
 		slog.Debug("no resource discoverer available", "service", service)
 		return nil, nil
 	}
 
+	if ok {
+		slog.Debug("using cached resource discovery", "service", service, "region", region, "count", len(cached))
+		return cached, nil
+	}
+
 	ctx := context.Background()
 	resources, err := discoverer.Discover(ctx, p.accountID, region)
 	if err != nil {
@@ -58,6 +79,13 @@ func (p *AWSProvider) DiscoverResources(service, region string) ([]provider.Reso
 		return nil, err
 	}
 
+	p.mu.Lock()
+	if p.discoveryCache == nil {
+		p.discoveryCache = make(map[discoveryKey][]provider.Resource)
+	}
+	p.discoveryCache[key] = resources
+	p.mu.Unlock()
+
 	slog.Debug("discovered resources", "service", service, "region", region, "count", len(resources))
 	return resources, nil
 }
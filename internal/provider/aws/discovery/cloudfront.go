@@ -39,7 +39,7 @@ func (d *CloudFrontDiscoverer) Discover(ctx context.Context, accountID, region s
 		return nil, nil
 	}
 
-	var resources []provider.Resource
+	resources := make([]provider.Resource, 0, len(output.DistributionList.Items))
 	for _, dist := range output.DistributionList.Items {
 		spec := map[string]interface{}{
 			"domain_name":    safeStr(dist.DomainName),
@@ -5,6 +5,7 @@ import (
 	"encoding/json"
 	"fmt"
 
+	"github.com/aws/aws-sdk-go-v2/aws"
 	"github.com/aws/aws-sdk-go-v2/service/ec2"
 	ec2types "github.com/aws/aws-sdk-go-v2/service/ec2/types"
 
@@ -18,6 +19,33 @@ type EC2API interface {
 	DescribeNatGateways(ctx context.Context, params *ec2.DescribeNatGatewaysInput, optFns ...func(*ec2.Options)) (*ec2.DescribeNatGatewaysOutput, error)
 }
 
+// ec2InstanceSpec and ec2VolumeSpec are the stored spec JSON for instances and
+// volumes. Fields are in key order so the encoding matches the sorted-key map
+// encoding used before; CountSpotInstances matches on the compact
+// "lifecycle":"spot" pair.
+type ec2InstanceSpec struct {
+	InstanceType string `json:"instance_type"`
+	Lifecycle    string `json:"lifecycle"`
+	Platform     string `json:"platform,omitempty"`
+}
+
+type ec2VolumeSpec struct {
+	Encrypted  *bool  `json:"encrypted"`
+	Iops       *int32 `json:"iops"`
+	SizeGB     *int32 `json:"size_gb"`
+	VolumeType string `json:"volume_type"`
+}
+
+// discoveredInstanceStates are the instance states worth inventorying.
+// Terminated and shutting-down instances no longer accrue cost, so they are
+// filtered out server-side instead of being paged through and stored.
+var discoveredInstanceStates = []string{
+	string(ec2types.InstanceStateNamePending),
+	string(ec2types.InstanceStateNameRunning),
+	string(ec2types.InstanceStateNameStopping),
+	string(ec2types.InstanceStateNameStopped),
+}
+
 // EC2ClientFactory creates EC2 clients for specific regions.
 type EC2ClientFactory func(region string) EC2API
 
@@ -37,58 +65,63 @@ func (d *EC2Discoverer) ServiceName() string {
 
 func (d *EC2Discoverer) Discover(ctx context.Context, accountID, region string) ([]provider.Resource, error) {
 	client := d.clientFactory(region)
-	var resources []provider.Resource
 
 	// Discover instances
 	instances, err := d.discoverInstances(ctx, client, accountID, region)
 	if err != nil {
 		return nil, fmt.Errorf("discovering EC2 instances: %w", err)
 	}
-	resources = append(resources, instances...)
 
 	// Discover volumes
 	volumes, err := d.discoverVolumes(ctx, client, accountID, region)
 	if err != nil {
 		return nil, fmt.Errorf("discovering EBS volumes: %w", err)
 	}
-	resources = append(resources, volumes...)
 
-	return resources, nil
+	resources := make([]provider.Resource, 0, len(instances)+len(volumes))
+	resources = append(resources, instances...)
+	return append(resources, volumes...), nil
 }
 
 func (d *EC2Discoverer) discoverInstances(ctx context.Context, client EC2API, accountID, region string) ([]provider.Resource, error) {
 	var resources []provider.Resource
 
-	output, err := client.DescribeInstances(ctx, &ec2.DescribeInstancesInput{})
-	if err != nil {
-		return nil, err
+	// A single DescribeInstances call returns only the first page, so walk
+	// every page at the largest page size the API allows.
+	paginator := ec2.NewDescribeInstancesPaginator(client, &ec2.DescribeInstancesInput{
+		Filters: []ec2types.Filter{
+			{Name: aws.String("instance-state-name"), Values: discoveredInstanceStates},
+		},
+		MaxResults: aws.Int32(1000),
+	})
+	for paginator.HasMorePages() {
+		output, err := paginator.NextPage(ctx)
+		if err != nil {
+			return nil, err
+		}
+		resources = appendInstances(resources, output.Reservations, accountID, region)
 	}
 
-	for _, reservation := range output.Reservations {
+	return resources, nil
+}
+
+func appendInstances(resources []provider.Resource, reservations []ec2types.Reservation, accountID, region string) []provider.Resource {
+	for _, reservation := range reservations {
 		for _, inst := range reservation.Instances {
 			lifecycle := "on-demand"
 			if inst.InstanceLifecycle == ec2types.InstanceLifecycleTypeSpot {
 				lifecycle = "spot"
 			}
 
-			spec := map[string]string{
-				"instance_type": string(inst.InstanceType),
-				"lifecycle":     lifecycle,
-			}
-			if inst.PlatformDetails != nil {
-				spec["platform"] = *inst.PlatformDetails
-			}
-			specJSON, _ := json.Marshal(spec)
+			specJSON, _ := json.Marshal(ec2InstanceSpec{
+				InstanceType: string(inst.InstanceType),
+				Lifecycle:    lifecycle,
+				Platform:     aws.ToString(inst.PlatformDetails),
+			})
 
 			tags := extractTags(inst.Tags)
 			tagsJSON, _ := json.Marshal(tags)
-
-			name := ""
-			for _, tag := range inst.Tags {
-				if tag.Key != nil && *tag.Key == "Name" && tag.Value != nil {
-					name = *tag.Value
-				}
-			}
+			name := tags["Name"]
 
 			instanceID := ""
 			if inst.InstanceId != nil {
@@ -110,35 +143,38 @@ func (d *EC2Discoverer) discoverInstances(ctx context.Context, client EC2API, ac
 		}
 	}
 
-	return resources, nil
+	return resources
 }
 
 func (d *EC2Discoverer) discoverVolumes(ctx context.Context, client EC2API, accountID, region string) ([]provider.Resource, error) {
 	var resources []provider.Resource
 
-	output, err := client.DescribeVolumes(ctx, &ec2.DescribeVolumesInput{})
-	if err != nil {
-		return nil, err
+	paginator := ec2.NewDescribeVolumesPaginator(client, &ec2.DescribeVolumesInput{
+		MaxResults: aws.Int32(500),
+	})
+	for paginator.HasMorePages() {
+		output, err := paginator.NextPage(ctx)
+		if err != nil {
+			return nil, err
+		}
+		resources = appendVolumes(resources, output.Volumes, accountID, region)
 	}
 
-	for _, vol := range output.Volumes {
-		spec := map[string]interface{}{
-			"volume_type": string(vol.VolumeType),
-			"size_gb":     vol.Size,
-			"iops":        vol.Iops,
-			"encrypted":   vol.Encrypted,
-		}
-		specJSON, _ := json.Marshal(spec)
+	return resources, nil
+}
+
+func appendVolumes(resources []provider.Resource, volumes []ec2types.Volume, accountID, region string) []provider.Resource {
+	for _, vol := range volumes {
+		specJSON, _ := json.Marshal(ec2VolumeSpec{
+			Encrypted:  vol.Encrypted,
+			Iops:       vol.Iops,
+			SizeGB:     vol.Size,
+			VolumeType: string(vol.VolumeType),
+		})
 
 		tags := extractTags(vol.Tags)
 		tagsJSON, _ := json.Marshal(tags)
-
-		name := ""
-		for _, tag := range vol.Tags {
-			if tag.Key != nil && *tag.Key == "Name" && tag.Value != nil {
-				name = *tag.Value
-			}
-		}
+		name := tags["Name"]
 
 		volumeID := ""
 		if vol.VolumeId != nil {
@@ -159,11 +195,11 @@ func (d *EC2Discoverer) discoverVolumes(ctx context.Context, client EC2API, acco
 		})
 	}
 
-	return resources, nil
+	return resources
 }
 
 func extractTags(tags []ec2types.Tag) map[string]string {
-	result := make(map[string]string)
+	result := make(map[string]string, len(tags))
 	for _, tag := range tags {
 		if tag.Key != nil && tag.Value != nil {
 			result[*tag.Key] = *tag.Value
@@ -4,6 +4,7 @@ import (
 	"context"
 	"testing"
 
+	"github.com/aws/aws-sdk-go-v2/aws"
 	"github.com/aws/aws-sdk-go-v2/service/ec2"
 	ec2types "github.com/aws/aws-sdk-go-v2/service/ec2/types"
 	"github.com/stretchr/testify/assert"
@@ -11,12 +12,14 @@ import (
 )
 
 type mockEC2Discovery struct {
-	instances *ec2.DescribeInstancesOutput
-	volumes   *ec2.DescribeVolumesOutput
-	natGWs    *ec2.DescribeNatGatewaysOutput
+	instancesInput *ec2.DescribeInstancesInput
+	instances      *ec2.DescribeInstancesOutput
+	volumes        *ec2.DescribeVolumesOutput
+	natGWs         *ec2.DescribeNatGatewaysOutput
 }
 
 func (m *mockEC2Discovery) DescribeInstances(ctx context.Context, params *ec2.DescribeInstancesInput, optFns ...func(*ec2.Options)) (*ec2.DescribeInstancesOutput, error) {
+	m.instancesInput = params
 	return m.instances, nil
 }
 
@@ -71,4 +74,66 @@ func TestEC2Discoverer(t *testing.T) {
 	assert.Equal(t, "web-server", resources[0].Name)
 	assert.Equal(t, "running", resources[0].State)
 	assert.Contains(t, resources[0].Spec, "m5.xlarge")
+	assert.Equal(t, `{"instance_type":"m5.xlarge","lifecycle":"on-demand","platform":"Linux/UNIX"}`, resources[0].Spec)
+
+	// Terminated and shutting-down instances are filtered out by the API
+	require.NotNil(t, mock.instancesInput)
+	require.Len(t, mock.instancesInput.Filters, 1)
+	assert.Equal(t, "instance-state-name", aws.ToString(mock.instancesInput.Filters[0].Name))
+	assert.ElementsMatch(t, []string{"pending", "running", "stopping", "stopped"}, mock.instancesInput.Filters[0].Values)
+}
+
+// pagedEC2Discovery serves DescribeInstances and DescribeVolumes from pages
+// keyed by the request's NextToken ("" for the first page).
+type pagedEC2Discovery struct {
+	mockEC2Discovery
+	instancePages map[string]*ec2.DescribeInstancesOutput
+	volumePages   map[string]*ec2.DescribeVolumesOutput
+}
+
+func (m *pagedEC2Discovery) DescribeInstances(ctx context.Context, params *ec2.DescribeInstancesInput, optFns ...func(*ec2.Options)) (*ec2.DescribeInstancesOutput, error) {
+	return m.instancePages[aws.ToString(params.NextToken)], nil
+}
+
+func (m *pagedEC2Discovery) DescribeVolumes(ctx context.Context, params *ec2.DescribeVolumesInput, optFns ...func(*ec2.Options)) (*ec2.DescribeVolumesOutput, error) {
+	return m.volumePages[aws.ToString(params.NextToken)], nil
+}
+
+func TestEC2Discoverer_Paginates(t *testing.T) {
+	running := &ec2types.InstanceState{Name: ec2types.InstanceStateNameRunning}
+	mock := &pagedEC2Discovery{
+		instancePages: map[string]*ec2.DescribeInstancesOutput{
+			"": {
+				Reservations: []ec2types.Reservation{
+					{Instances: []ec2types.Instance{{InstanceId: aws.String("i-1"), State: running}}},
+				},
+				NextToken: aws.String("page-2"),
+			},
+			"page-2": {
+				Reservations: []ec2types.Reservation{
+					{Instances: []ec2types.Instance{{InstanceId: aws.String("i-2"), State: running}}},
+				},
+			},
+		},
+		volumePages: map[string]*ec2.DescribeVolumesOutput{
+			"": {
+				Volumes:   []ec2types.Volume{{VolumeId: aws.String("vol-1")}},
+				NextToken: aws.String("page-2"),
+			},
+			"page-2": {
+				Volumes: []ec2types.Volume{{VolumeId: aws.String("vol-2")}},
+			},
+		},
+	}
+
+	d := NewEC2Discoverer(func(region string) EC2API { return mock })
+
+	resources, err := d.Discover(context.Background(), "123456789012", "us-east-1")
+	require.NoError(t, err)
+
+	var ids []string
+	for _, r := range resources {
+		ids = append(ids, r.ResourceID)
+	}
+	assert.Equal(t, []string{"i-1", "i-2", "vol-1", "vol-2"}, ids)
 }
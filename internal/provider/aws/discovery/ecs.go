@@ -52,7 +52,7 @@ func (d *ECSDiscoverer) Discover(ctx context.Context, accountID, region string)
 		return nil, fmt.Errorf("describing ECS clusters: %w", err)
 	}
 
-	var resources []provider.Resource
+	resources := make([]provider.Resource, 0, len(descOutput.Clusters))
 	for _, cluster := range descOutput.Clusters {
 		spec := map[string]interface{}{
 			"running_tasks":      cluster.RunningTasksCount,
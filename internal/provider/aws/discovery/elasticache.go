@@ -40,7 +40,7 @@ func (d *ElastiCacheDiscoverer) Discover(ctx context.Context, accountID, region
 		return nil, fmt.Errorf("describing ElastiCache clusters: %w", err)
 	}
 
-	var resources []provider.Resource
+	resources := make([]provider.Resource, 0, len(output.CacheClusters))
 	for _, cluster := range output.CacheClusters {
 		spec := map[string]interface{}{
 			"cache_node_type": safeStr(cluster.CacheNodeType),
@@ -40,7 +40,7 @@ func (d *LambdaDiscoverer) Discover(ctx context.Context, accountID, region strin
 		return nil, fmt.Errorf("listing Lambda functions: %w", err)
 	}
 
-	var resources []provider.Resource
+	resources := make([]provider.Resource, 0, len(output.Functions))
 	for _, fn := range output.Functions {
 		spec := map[string]interface{}{
 			"runtime":    string(fn.Runtime),
@@ -32,7 +32,7 @@ func (d *NATDiscoverer) Discover(ctx context.Context, accountID, region string)
 		return nil, fmt.Errorf("describing NAT gateways: %w", err)
 	}
 
-	var resources []provider.Resource
+	resources := make([]provider.Resource, 0, len(output.NatGateways))
 	for _, gw := range output.NatGateways {
 		spec := map[string]interface{}{
 			"connectivity_type": string(gw.ConnectivityType),
@@ -46,7 +46,7 @@ func (d *NATDiscoverer) Discover(ctx context.Context, accountID, region string)
 		specJSON, _ := json.Marshal(spec)
 
 		name := ""
-		tags := make(map[string]string)
+		tags := make(map[string]string, len(gw.Tags))
 		for _, tag := range gw.Tags {
 			if tag.Key != nil && tag.Value != nil {
 				tags[*tag.Key] = *tag.Value
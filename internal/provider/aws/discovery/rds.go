@@ -40,7 +40,7 @@ func (d *RDSDiscoverer) Discover(ctx context.Context, accountID, region string)
 		return nil, fmt.Errorf("describing RDS instances: %w", err)
 	}
 
-	var resources []provider.Resource
+	resources := make([]provider.Resource, 0, len(output.DBInstances))
 	for _, db := range output.DBInstances {
 		spec := map[string]interface{}{
 			"instance_class":    safeStr(db.DBInstanceClass),
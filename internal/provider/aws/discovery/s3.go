@@ -35,7 +35,7 @@ func (d *S3Discoverer) Discover(ctx context.Context, accountID, region string) (
 		return nil, fmt.Errorf("listing S3 buckets: %w", err)
 	}
 
-	var resources []provider.Resource
+	resources := make([]provider.Resource, 0, len(output.Buckets))
 	for _, bucket := range output.Buckets {
 		name := ""
 		if bucket.Name != nil {
@@ -0,0 +1,91 @@
+package aws
+
+import (
+	"context"
+	"sync"
+	"sync/atomic"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	"github.com/helmcode/finops-cli/internal/provider"
+	"github.com/helmcode/finops-cli/internal/provider/aws/discovery"
+)
+
+// countingDiscoverer records how many times Discover is invoked.
+type countingDiscoverer struct {
+	calls     atomic.Int32
+	resources []provider.Resource
+}
+
+func (d *countingDiscoverer) ServiceName() string {
+	return "Amazon Relational Database Service"
+}
+
+func (d *countingDiscoverer) Discover(ctx context.Context, accountID, region string) ([]provider.Resource, error) {
+	d.calls.Add(1)
+	return d.resources, nil
+}
+
+func TestDiscoverResources_MemoizesByServiceAndRegion(t *testing.T) {
+	d := &countingDiscoverer{
+		resources: []provider.Resource{{ResourceID: "db-1", Region: "us-east-1"}},
+	}
+	reg := discovery.NewRegistry()
+	reg.Register(d)
+
+	p := &AWSProvider{accountID: "123456789012", registry: reg}
+
+	first, err := p.DiscoverResources(d.ServiceName(), "us-east-1")
+	require.NoError(t, err)
+	second, err := p.DiscoverResources(d.ServiceName(), "us-east-1")
+	require.NoError(t, err)
+
+	assert.Equal(t, first, second)
+	assert.Equal(t, int32(1), d.calls.Load())
+
+	// A different region is a different cache entry.
+	_, err = p.DiscoverResources(d.ServiceName(), "eu-west-1")
+	require.NoError(t, err)
+	assert.Equal(t, int32(2), d.calls.Load())
+}
+
+func TestDiscoverResources_ConcurrentCalls(t *testing.T) {
+	d := &countingDiscoverer{
+		resources: []provider.Resource{{ResourceID: "db-1"}},
+	}
+	reg := discovery.NewRegistry()
+	reg.Register(d)
+
+	p := &AWSProvider{accountID: "123456789012", registry: reg}
+	regions := []string{"us-east-1", "us-west-2", "eu-west-1", "ap-south-1"}
+
+	var wg sync.WaitGroup
+	for i := 0; i < 32; i++ {
+		wg.Add(1)
+		go func(region string) {
+			defer wg.Done()
+			resources, err := p.DiscoverResources(d.ServiceName(), region)
+			assert.NoError(t, err)
+			assert.Len(t, resources, 1)
+		}(regions[i%len(regions)])
+	}
+	wg.Wait()
+
+	// Every region is cached after the first round of calls.
+	calls := d.calls.Load()
+	for _, region := range regions {
+		_, err := p.DiscoverResources(d.ServiceName(), region)
+		require.NoError(t, err)
+	}
+	assert.Equal(t, calls, d.calls.Load())
+}
+
+func TestDiscoverResources_UnknownService(t *testing.T) {
+	p := &AWSProvider{registry: discovery.NewRegistry()}
+
+	resources, err := p.DiscoverResources("Amazon Managed Blockchain", "us-east-1")
+	require.NoError(t, err)
+	assert.Nil(t, resources)
+}
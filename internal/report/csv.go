@@ -4,6 +4,7 @@ import (
 	"encoding/csv"
 	"fmt"
 	"os"
+	"strconv"
 
 	"github.com/helmcode/finops-cli/internal/analysis"
 	"github.com/helmcode/finops-cli/internal/store"
@@ -11,20 +12,9 @@ import (
 
 // GenerateSummaryCSV writes detailed cost data to a CSV file with account and region breakdown.
 func GenerateSummaryCSV(outputPath string, rows []store.GetCostByAccountAndServiceRow) error {
-	f, err := os.Create(outputPath)
-	if err != nil {
-		return fmt.Errorf("creating CSV file: %w", err)
-	}
-	defer f.Close()
-
-	w := csv.NewWriter(f)
-	defer w.Flush()
-
-	if err := w.Write([]string{"Account ID", "Service", "Region", "Total Cost", "Currency"}); err != nil {
-		return err
-	}
-
-	for _, row := range rows {
+	header := []string{"Account ID", "Service", "Region", "Total Cost", "Currency"}
+	return writeCSV(outputPath, header, len(rows), func(i int, record []string) {
+		row := rows[i]
 		amount := 0.0
 		if row.TotalAmount.Valid {
 			amount = row.TotalAmount.Float64
@@ -33,80 +23,56 @@ func GenerateSummaryCSV(outputPath string, rows []store.GetCostByAccountAndServi
 		if row.Region.Valid {
 			region = row.Region.String
 		}
-		if err := w.Write([]string{
-			row.AccountID,
-			row.Service,
-			region,
-			fmt.Sprintf("%.2f", amount),
-			row.Currency,
-		}); err != nil {
-			return err
-		}
-	}
-
-	return nil
+		record[0] = row.AccountID
+		record[1] = row.Service
+		record[2] = region
+		record[3] = formatFixed(amount, 2)
+		record[4] = row.Currency
+	})
 }
 
 // GenerateTrendCSV writes trend data to a CSV file.
 func GenerateTrendCSV(outputPath string, data *analysis.TrendData) error {
-	f, err := os.Create(outputPath)
-	if err != nil {
-		return fmt.Errorf("creating CSV file: %w", err)
-	}
-	defer f.Close()
-
-	w := csv.NewWriter(f)
-	defer w.Flush()
-
-	if err := w.Write([]string{"Period", "Amount"}); err != nil {
-		return err
-	}
-
-	for _, dp := range data.DataPoints {
-		if err := w.Write([]string{
-			dp.Period,
-			fmt.Sprintf("%.2f", dp.Amount),
-		}); err != nil {
-			return err
-		}
-	}
-
-	return nil
+	header := []string{"Period", "Amount"}
+	return writeCSV(outputPath, header, len(data.DataPoints), func(i int, record []string) {
+		dp := data.DataPoints[i]
+		record[0] = dp.Period
+		record[1] = formatFixed(dp.Amount, 2)
+	})
 }
 
 // GenerateAnomaliesCSV writes anomaly data to a CSV file.
 func GenerateAnomaliesCSV(outputPath string, data []analysis.AnomalyResult) error {
-	f, err := os.Create(outputPath)
-	if err != nil {
-		return fmt.Errorf("creating CSV file: %w", err)
-	}
-	defer f.Close()
-
-	w := csv.NewWriter(f)
-	defer w.Flush()
-
-	if err := w.Write([]string{"Period", "Service", "Expected", "Actual", "Deviation", "Severity"}); err != nil {
-		return err
-	}
-
-	for _, a := range data {
-		if err := w.Write([]string{
-			a.Period,
-			a.Service,
-			fmt.Sprintf("%.2f", a.Expected),
-			fmt.Sprintf("%.2f", a.Actual),
-			fmt.Sprintf("%.2f", a.Deviation),
-			string(a.Severity),
-		}); err != nil {
-			return err
-		}
-	}
-
-	return nil
+	header := []string{"Period", "Service", "Expected", "Actual", "Deviation", "Severity"}
+	return writeCSV(outputPath, header, len(data), func(i int, record []string) {
+		a := data[i]
+		record[0] = a.Period
+		record[1] = a.Service
+		record[2] = formatFixed(a.Expected, 2)
+		record[3] = formatFixed(a.Actual, 2)
+		record[4] = formatFixed(a.Deviation, 2)
+		record[5] = string(a.Severity)
+	})
 }
 
 // GenerateCompareCSV writes comparison data to a CSV file.
 func GenerateCompareCSV(outputPath string, data *analysis.CompareResult) error {
+	header := []string{"Service", "Previous", "Current", "Change", "% Change", "Currency"}
+	return writeCSV(outputPath, header, len(data.ServiceDeltas), func(i int, record []string) {
+		d := data.ServiceDeltas[i]
+		record[0] = d.Service
+		record[1] = formatFixed(d.PreviousAmount, 2)
+		record[2] = formatFixed(d.CurrentAmount, 2)
+		record[3] = formatFixed(d.AbsoluteChange, 2)
+		record[4] = formatFixed(d.PercentChange, 1)
+		record[5] = d.Currency
+	})
+}
+
+// writeCSV writes header followed by n rows to outputPath. fill populates the
+// i-th row into record, a single slice of len(header) reused for every row
+// since csv.Writer does not retain it.
+func writeCSV(outputPath string, header []string, n int, fill func(i int, record []string)) error {
 	f, err := os.Create(outputPath)
 	if err != nil {
 		return fmt.Errorf("creating CSV file: %w", err)
@@ -114,24 +80,23 @@ func GenerateCompareCSV(outputPath string, data *analysis.CompareResult) error {
 	defer f.Close()
 
 	w := csv.NewWriter(f)
-	defer w.Flush()
-
-	if err := w.Write([]string{"Service", "Previous", "Current", "Change", "% Change", "Currency"}); err != nil {
+	if err := w.Write(header); err != nil {
 		return err
 	}
 
-	for _, d := range data.ServiceDeltas {
-		if err := w.Write([]string{
-			d.Service,
-			fmt.Sprintf("%.2f", d.PreviousAmount),
-			fmt.Sprintf("%.2f", d.CurrentAmount),
-			fmt.Sprintf("%.2f", d.AbsoluteChange),
-			fmt.Sprintf("%.1f", d.PercentChange),
-			d.Currency,
-		}); err != nil {
+	record := make([]string, len(header))
+	for i := 0; i < n; i++ {
+		fill(i, record)
+		if err := w.Write(record); err != nil {
 			return err
 		}
 	}
 
-	return nil
+	w.Flush()
+	return w.Error()
+}
+
+// formatFixed formats f with prec decimal places, matching fmt's "%.Nf".
+func formatFixed(f float64, prec int) string {
+	return strconv.FormatFloat(f, 'f', prec, 64)
 }
@@ -1,13 +1,15 @@
 package report
 
 import (
+	"bufio"
 	"embed"
 	"fmt"
 	"html/template"
+	"math"
 	"os"
 	"os/exec"
 	"runtime"
-	"strings"
+	"strconv"
 	"time"
 
 	"github.com/helmcode/finops-cli/internal/analysis"
@@ -20,33 +22,24 @@ var templatesFS embed.FS
 // formatMoney formats a float as a money string with thousand separators.
 // e.g., 39990.5678 → "39,990.57"
 func formatMoney(f float64) string {
-	negative := f < 0
-	if negative {
-		f = -f
+	// Format the absolute value once, then copy it into a pre-sized buffer
+	// inserting separators; this runs for every money cell in a report.
+	var scratch [32]byte
+	digits := strconv.AppendFloat(scratch[:0], math.Abs(f), 'f', 2, 64)
+	intLen := len(digits) - 3 // digits before ".xx"
+
+	out := make([]byte, 0, len(digits)+intLen/3+1)
+	if f < 0 {
+		out = append(out, '-')
 	}
-
-	// Use Sprintf for correct rounding, then insert commas
-	formatted := fmt.Sprintf("%.2f", f)
-	parts := strings.SplitN(formatted, ".", 2)
-	intStr := parts[0]
-	decStr := parts[1]
-
-	// Add thousand separators to integer part
-	if len(intStr) > 3 {
-		var groups []string
-		for len(intStr) > 3 {
-			groups = append([]string{intStr[len(intStr)-3:]}, groups...)
-			intStr = intStr[:len(intStr)-3]
+	for i := 0; i < intLen; i++ {
+		if i > 0 && (intLen-i)%3 == 0 {
+			out = append(out, ',')
 		}
-		groups = append([]string{intStr}, groups...)
-		intStr = strings.Join(groups, ",")
-	}
-
-	result := intStr + "." + decStr
-	if negative {
-		return "-" + result
+		out = append(out, digits[i])
 	}
-	return result
+	out = append(out, digits[intLen:]...)
+	return string(out)
 }
 
 // funcMap provides helper functions for templates.
@@ -56,7 +49,7 @@ var funcMap = template.FuncMap{
 	"mulf":        func(a, b float64) float64 { return a * b },
 	"max":         func(a, b float64) float64 { if a > b { return a }; return b },
 	"formatMoney": formatMoney,
-	"formatPct":   func(f float64) string { return fmt.Sprintf("%.1f", f) },
+	"formatPct":   func(f float64) string { return formatFixed(f, 1) },
 	"gt0":         func(f float64) bool { return f > 0 },
 }
 
@@ -122,9 +115,13 @@ func GenerateHTML(templateName, outputPath string, data ReportData) error {
 	}
 	defer f.Close()
 
-	if err := tmpl.ExecuteTemplate(f, templateName+".html", data); err != nil {
+	w := bufio.NewWriter(f)
+	if err := tmpl.ExecuteTemplate(w, templateName+".html", data); err != nil {
 		return fmt.Errorf("executing template: %w", err)
 	}
+	if err := w.Flush(); err != nil {
+		return fmt.Errorf("writing output file: %w", err)
+	}
 
 	return nil
 }
@@ -4,10 +4,12 @@ import (
 	"encoding/json"
 	"fmt"
 	"io"
+	"math"
 	"os"
 	"time"
 
 	"github.com/helmcode/finops-cli/internal/analysis"
+	"github.com/helmcode/finops-cli/internal/store"
 )
 
 // --- JSON output structs ---
@@ -217,17 +219,19 @@ func GenerateSummaryJSON(outputPath string, data ReportData) error {
 		ResourcesDiscovered: data.TotalResources,
 	}
 
+	// Share of total spend is amount * pctScale; zero when there is no spend.
+	pctScale := 0.0
+	if summaryData.TotalSpend > 0 {
+		pctScale = 100 / summaryData.TotalSpend
+	}
+
 	// Cost by account
 	for _, acct := range data.AccountDetails {
-		pct := 0.0
-		if summaryData.TotalSpend > 0 {
-			pct = (acct.TotalAmount / summaryData.TotalSpend) * 100
-		}
 		ja := JSONAccountDetail{
 			AccountID:     acct.AccountID,
 			TotalAmount:   roundTo(acct.TotalAmount, 2),
 			Currency:      acct.Currency,
-			Percentage:    roundTo(pct, 1),
+			Percentage:    roundTo(acct.TotalAmount*pctScale, 1),
 			ResourceCount: acct.ResourceCount,
 		}
 		for _, svc := range acct.TopServices {
@@ -249,15 +253,11 @@ func GenerateSummaryJSON(outputPath string, data ReportData) error {
 
 	// Top services
 	for _, svc := range summaryData.TopServices {
-		pct := 0.0
-		if summaryData.TotalSpend > 0 {
-			pct = (svc.TotalAmount / summaryData.TotalSpend) * 100
-		}
 		report.TopServices = append(report.TopServices, JSONServiceCost{
 			Service:     svc.Service,
 			TotalAmount: roundTo(svc.TotalAmount, 2),
 			Currency:    svc.Currency,
-			Percentage:  roundTo(pct, 1),
+			Percentage:  roundTo(svc.TotalAmount*pctScale, 1),
 		})
 	}
 
@@ -413,78 +413,30 @@ func GenerateCompareJSON(outputPath string, data *analysis.CompareResult, curren
 }
 
 // GenerateResourcesJSON writes discovered resources as JSON.
-func GenerateResourcesJSON(outputPath string, resources interface{}) error {
+func GenerateResourcesJSON(outputPath string, resources []store.Resource) error {
 	report := JSONResourcesReport{
 		ReportType:  "resources",
 		GeneratedAt: nowISO(),
+		TotalCount:  len(resources),
 	}
-
-	// Use JSON marshal/unmarshal to convert store.Resource slice
-	raw, err := json.Marshal(resources)
-	if err != nil {
-		return fmt.Errorf("marshaling resources: %w", err)
+	if len(resources) > 0 {
+		report.Resources = make([]JSONResourceDetail, len(resources))
 	}
 
-	var items []map[string]interface{}
-	if err := json.Unmarshal(raw, &items); err != nil {
-		return fmt.Errorf("unmarshaling resources: %w", err)
-	}
-
-	for _, item := range items {
-		r := JSONResourceDetail{
-			Service:      strField(item, "service"),
-			ResourceType: strField(item, "resource_type"),
-			ResourceID:   strField(item, "resource_id"),
-			AccountID:    strField(item, "account_id"),
-		}
-		if v, ok := item["name"]; ok && v != nil {
-			if m, ok := v.(map[string]interface{}); ok {
-				if valid, _ := m["Valid"].(bool); valid {
-					r.Name, _ = m["String"].(string)
-				}
-			} else if s, ok := v.(string); ok {
-				r.Name = s
-			}
-		}
-		if v, ok := item["region"]; ok && v != nil {
-			if m, ok := v.(map[string]interface{}); ok {
-				if valid, _ := m["Valid"].(bool); valid {
-					r.Region, _ = m["String"].(string)
-				}
-			} else if s, ok := v.(string); ok {
-				r.Region = s
-			}
-		}
-		if v, ok := item["state"]; ok && v != nil {
-			if m, ok := v.(map[string]interface{}); ok {
-				if valid, _ := m["Valid"].(bool); valid {
-					r.State, _ = m["String"].(string)
-				}
-			} else if s, ok := v.(string); ok {
-				r.State = s
-			}
+	for i, r := range resources {
+		// NullString.String is empty when not Valid, which omitempty drops.
+		report.Resources[i] = JSONResourceDetail{
+			Service:      r.Service,
+			ResourceType: r.ResourceType,
+			ResourceID:   r.ResourceID,
+			Name:         r.Name.String,
+			Region:       r.Region.String,
+			State:        r.State.String,
+			AccountID:    r.AccountID,
+			Spec:         r.Spec.String,
+			Tags:         r.Tags.String,
 		}
-		if v, ok := item["spec"]; ok && v != nil {
-			if m, ok := v.(map[string]interface{}); ok {
-				if valid, _ := m["Valid"].(bool); valid {
-					r.Spec, _ = m["String"].(string)
-				}
-			} else if s, ok := v.(string); ok {
-				r.Spec = s
-			}
-		}
-		if v, ok := item["tags"]; ok && v != nil {
-			if m, ok := v.(map[string]interface{}); ok {
-				if valid, _ := m["Valid"].(bool); valid {
-					r.Tags, _ = m["String"].(string)
-				}
-			} else if s, ok := v.(string); ok {
-				r.Tags = s
-			}
-		}
-		report.Resources = append(report.Resources, r)
 	}
-	report.TotalCount = len(report.Resources)
 
 	w, closer, err := jsonWriter(outputPath)
 	if err != nil {
@@ -494,21 +446,13 @@ func GenerateResourcesJSON(outputPath string, resources interface{}) error {
 	return writeJSON(w, report)
 }
 
-func strField(m map[string]interface{}, key string) string {
-	if v, ok := m[key]; ok {
-		if s, ok := v.(string); ok {
-			return s
-		}
-	}
-	return ""
-}
-
+// roundTo rounds f half away from zero to the given number of decimals.
 func roundTo(f float64, decimals int) float64 {
 	switch decimals {
 	case 1:
-		return float64(int(f*10+0.5)) / 10
+		return math.Round(f*10) / 10
 	case 2:
-		return float64(int(f*100+0.5)) / 100
+		return math.Round(f*100) / 100
 	default:
 		return f
 	}
@@ -2,6 +2,7 @@ package report
 
 import (
 	database_sql "database/sql"
+	"encoding/json"
 	"os"
 	"path/filepath"
 	"testing"
@@ -81,6 +82,35 @@ func TestGenerateHTML_Trend(t *testing.T) {
 	assert.Contains(t, string(content), "1,100.00")
 }
 
+func TestFormatMoney(t *testing.T) {
+	tests := []struct {
+		in   float64
+		want string
+	}{
+		{0, "0.00"},
+		{0.005, "0.01"},
+		{999.999, "1,000.00"},
+		{39990.5678, "39,990.57"},
+		{100000, "100,000.00"},
+		{1234567.891, "1,234,567.89"},
+		{-1234.5, "-1,234.50"},
+		{-0.25, "-0.25"},
+	}
+
+	for _, tt := range tests {
+		assert.Equal(t, tt.want, formatMoney(tt.in), "formatMoney(%v)", tt.in)
+	}
+}
+
+func TestRoundTo(t *testing.T) {
+	assert.Equal(t, 1234.57, roundTo(1234.5678, 2))
+	assert.Equal(t, 12.3, roundTo(12.345, 1))
+	assert.Equal(t, -1.23, roundTo(-1.234, 2))
+	assert.Equal(t, -45.7, roundTo(-45.68, 1))
+	assert.Equal(t, 3e12, roundTo(3e12, 2))
+	assert.Equal(t, 0.123456, roundTo(0.123456, 3))
+}
+
 func TestGenerateSummaryCSV(t *testing.T) {
 	tmpDir := t.TempDir()
 	outputPath := filepath.Join(tmpDir, "summary.csv")
@@ -154,3 +184,86 @@ func TestGenerateCompareCSV(t *testing.T) {
 	assert.Contains(t, string(content), "Service,Previous,Current,Change,% Change,Currency")
 	assert.Contains(t, string(content), "Amazon EC2")
 }
+
+func TestGenerateSummaryJSON_Percentages(t *testing.T) {
+	tmpDir := t.TempDir()
+	outputPath := filepath.Join(tmpDir, "summary.json")
+
+	data := ReportData{
+		PeriodStart: "2026-01-01",
+		PeriodEnd:   "2026-03-01",
+		Data: &analysis.SummaryData{
+			TotalSpend: 3000,
+			Currency:   "USD",
+			TopServices: []analysis.ServiceCost{
+				{Service: "Amazon EC2", TotalAmount: 2000, Currency: "USD"},
+				{Service: "Amazon S3", TotalAmount: 1000, Currency: "USD"},
+			},
+		},
+		AccountDetails: []AccountDetail{
+			{AccountID: "123456789012", TotalAmount: 3000, Currency: "USD"},
+		},
+	}
+
+	err := GenerateSummaryJSON(outputPath, data)
+	require.NoError(t, err)
+
+	content, err := os.ReadFile(outputPath)
+	require.NoError(t, err)
+
+	var got JSONSummaryReport
+	require.NoError(t, json.Unmarshal(content, &got))
+	require.Len(t, got.TopServices, 2)
+	assert.Equal(t, 66.7, got.TopServices[0].Percentage)
+	assert.Equal(t, 33.3, got.TopServices[1].Percentage)
+	require.Len(t, got.CostByAccount, 1)
+	assert.Equal(t, 100.0, got.CostByAccount[0].Percentage)
+}
+
+func TestGenerateResourcesJSON(t *testing.T) {
+	tmpDir := t.TempDir()
+	outputPath := filepath.Join(tmpDir, "resources.json")
+
+	resources := []store.Resource{
+		{
+			Provider: "aws", AccountID: "123456789012", Service: "Amazon EC2",
+			ResourceID: "i-abc123", ResourceType: "ec2:instance",
+			Name:   database_sql.NullString{String: "web-server", Valid: true},
+			Region: database_sql.NullString{String: "us-east-1", Valid: true},
+			Spec:   database_sql.NullString{String: `{"instance_type":"m5.xlarge"}`, Valid: true},
+			State:  database_sql.NullString{String: "running", Valid: true},
+		},
+		{
+			Provider: "aws", AccountID: "123456789012", Service: "Amazon S3",
+			ResourceID: "my-bucket", ResourceType: "s3:bucket",
+		},
+	}
+
+	err := GenerateResourcesJSON(outputPath, resources)
+	require.NoError(t, err)
+
+	content, err := os.ReadFile(outputPath)
+	require.NoError(t, err)
+
+	var got JSONResourcesReport
+	require.NoError(t, json.Unmarshal(content, &got))
+	assert.Equal(t, "resources", got.ReportType)
+	assert.Equal(t, 2, got.TotalCount)
+	require.Len(t, got.Resources, 2)
+	assert.Equal(t, "web-server", got.Resources[0].Name)
+	assert.Equal(t, "us-east-1", got.Resources[0].Region)
+	assert.Equal(t, "running", got.Resources[0].State)
+	assert.Equal(t, `{"instance_type":"m5.xlarge"}`, got.Resources[0].Spec)
+	assert.Equal(t, "my-bucket", got.Resources[1].ResourceID)
+	assert.Empty(t, got.Resources[1].Name)
+	assert.NotContains(t, string(content), `"Valid"`)
+
+	// An empty inventory keeps the previous "resources": null encoding
+	emptyPath := filepath.Join(tmpDir, "empty.json")
+	require.NoError(t, GenerateResourcesJSON(emptyPath, nil))
+
+	content, err = os.ReadFile(emptyPath)
+	require.NoError(t, err)
+	assert.Contains(t, string(content), `"total_count": 0`)
+	assert.Contains(t, string(content), `"resources": null`)
+}
@@ -528,6 +528,49 @@ func (q *Queries) GetMonthlyCostByAccount(ctx context.Context, arg GetMonthlyCos
 	return items, nil
 }
 
+const getMonthlyCostByService = `-- name: GetMonthlyCostByService :many
+SELECT service, period_start, SUM(amount) AS total_amount, currency
+FROM cost_records
+WHERE provider = ?
+GROUP BY service, period_start, currency
+ORDER BY service, period_start ASC
+`
+
+type GetMonthlyCostByServiceRow struct {
+	Service     string          `json:"service"`
+	PeriodStart string          `json:"period_start"`
+	TotalAmount sql.NullFloat64 `json:"total_amount"`
+	Currency    string          `json:"currency"`
+}
+
+func (q *Queries) GetMonthlyCostByService(ctx context.Context, provider string) ([]GetMonthlyCostByServiceRow, error) {
+	rows, err := q.db.QueryContext(ctx, getMonthlyCostByService, provider)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	items := []GetMonthlyCostByServiceRow{}
+	for rows.Next() {
+		var i GetMonthlyCostByServiceRow
+		if err := rows.Scan(
+			&i.Service,
+			&i.PeriodStart,
+			&i.TotalAmount,
+			&i.Currency,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Close(); err != nil {
+		return nil, err
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
 const getMonthlyCostTrend = `-- name: GetMonthlyCostTrend :many
 SELECT period_start, SUM(amount) AS total_amount, currency
 FROM cost_records
@@ -155,6 +155,53 @@ func TestGetTotalCostByService(t *testing.T) {
 	assert.Equal(t, 2200.00, results[0].TotalAmount.Float64)
 }
 
+func TestGetMonthlyCostByService(t *testing.T) {
+	s := setupTestDB(t)
+	ctx := context.Background()
+
+	records := []struct {
+		service string
+		region  string
+		period  string
+		amount  float64
+	}{
+		{"Amazon RDS", "us-east-1", "2026-02-01", 500.00},
+		{"Amazon EC2", "us-east-1", "2026-02-01", 1200.00},
+		{"Amazon EC2", "us-east-1", "2026-01-01", 1000.00},
+		{"Amazon EC2", "eu-west-1", "2026-01-01", 300.00},
+	}
+
+	for _, r := range records {
+		err := s.Queries.UpsertCostRecord(ctx, UpsertCostRecordParams{
+			Provider:    "aws",
+			AccountID:   "123456789012",
+			Service:     r.service,
+			Region:      sql.NullString{String: r.region, Valid: true},
+			PeriodStart: r.period,
+			PeriodEnd:   "2026-03-01",
+			Granularity: "MONTHLY",
+			Amount:      r.amount,
+			Currency:    "USD",
+			SyncedAt:    "2026-03-18T00:00:00Z",
+		})
+		require.NoError(t, err)
+	}
+
+	results, err := s.Queries.GetMonthlyCostByService(ctx, "aws")
+	require.NoError(t, err)
+	require.Len(t, results, 3)
+
+	// Ordered by service, then period; regions are summed per period
+	assert.Equal(t, "Amazon EC2", results[0].Service)
+	assert.Equal(t, "2026-01-01", results[0].PeriodStart)
+	assert.Equal(t, 1300.00, results[0].TotalAmount.Float64)
+	assert.Equal(t, "Amazon EC2", results[1].Service)
+	assert.Equal(t, "2026-02-01", results[1].PeriodStart)
+	assert.Equal(t, 1200.00, results[1].TotalAmount.Float64)
+	assert.Equal(t, "Amazon RDS", results[2].Service)
+	assert.Equal(t, 500.00, results[2].TotalAmount.Float64)
+}
+
 func TestUpsertResource(t *testing.T) {
 	s := setupTestDB(t)
 	ctx := context.Background()
@@ -220,6 +267,57 @@ func TestSyncHistory(t *testing.T) {
 	assert.True(t, sync.CompletedAt.Valid)
 }
 
+func TestGetLatestCompletedSyncForPeriod(t *testing.T) {
+	s := setupTestDB(t)
+	ctx := context.Background()
+
+	insert := func(costRecords int64, completedAt string) {
+		id, err := s.Queries.InsertSyncHistory(ctx, InsertSyncHistoryParams{
+			Provider:    "aws",
+			AccountID:   "123456789012",
+			PeriodStart: "2025-10-01",
+			PeriodEnd:   "2026-03-01",
+			StartedAt:   "2026-03-18T00:00:00Z",
+		})
+		require.NoError(t, err)
+		if completedAt == "" {
+			return
+		}
+		err = s.Queries.UpdateSyncHistoryCompleted(ctx, UpdateSyncHistoryCompletedParams{
+			CostRecords: sql.NullInt64{Int64: costRecords, Valid: true},
+			CompletedAt: sql.NullString{String: completedAt, Valid: true},
+			ID:          id,
+		})
+		require.NoError(t, err)
+	}
+
+	params := GetLatestCompletedSyncForPeriodParams{
+		Provider:    "aws",
+		AccountID:   "123456789012",
+		PeriodStart: "2025-10-01",
+		PeriodEnd:   "2026-03-01",
+	}
+
+	// Nothing completed yet
+	insert(0, "")
+	_, err := s.Queries.GetLatestCompletedSyncForPeriod(ctx, params)
+	assert.ErrorIs(t, err, sql.ErrNoRows)
+
+	// Completed syncs that stored no cost records are ignored
+	insert(42, "2026-03-18T00:01:00Z")
+	insert(0, "2026-03-18T02:00:00Z")
+
+	sync, err := s.Queries.GetLatestCompletedSyncForPeriod(ctx, params)
+	require.NoError(t, err)
+	assert.Equal(t, int64(42), sync.CostRecords.Int64)
+	assert.Equal(t, "2026-03-18T00:01:00Z", sync.CompletedAt.String)
+
+	// A different period does not match
+	params.PeriodStart = "2025-09-01"
+	_, err = s.Queries.GetLatestCompletedSyncForPeriod(ctx, params)
+	assert.ErrorIs(t, err, sql.ErrNoRows)
+}
+
 func TestConfig(t *testing.T) {
 	s := setupTestDB(t)
 	ctx := context.Background()
@@ -21,6 +21,47 @@ func (q *Queries) CountSyncHistory(ctx context.Context) (int64, error) {
 	return count, err
 }
 
+const getLatestCompletedSyncForPeriod = `-- name: GetLatestCompletedSyncForPeriod :one
+SELECT id, provider, account_id, region, period_start, period_end, cost_records, resources_found, started_at, completed_at FROM sync_history
+WHERE provider = ? AND account_id = ? AND period_start = ? AND period_end = ?
+  AND completed_at IS NOT NULL AND cost_records > 0
+ORDER BY completed_at DESC
+LIMIT 1
+`
+
+type GetLatestCompletedSyncForPeriodParams struct {
+	Provider    string `json:"provider"`
+	AccountID   string `json:"account_id"`
+	PeriodStart string `json:"period_start"`
+	PeriodEnd   string `json:"period_end"`
+}
+
+// cost_records holds only records fetched from the provider during that run;
+// scans that reuse cached cost data store 0. Requiring cost_records > 0 keeps
+// the cache TTL anchored to the last live fetch rather than the last scan.
+func (q *Queries) GetLatestCompletedSyncForPeriod(ctx context.Context, arg GetLatestCompletedSyncForPeriodParams) (SyncHistory, error) {
+	row := q.db.QueryRowContext(ctx, getLatestCompletedSyncForPeriod,
+		arg.Provider,
+		arg.AccountID,
+		arg.PeriodStart,
+		arg.PeriodEnd,
+	)
+	var i SyncHistory
+	err := row.Scan(
+		&i.ID,
+		&i.Provider,
+		&i.AccountID,
+		&i.Region,
+		&i.PeriodStart,
+		&i.PeriodEnd,
+		&i.CostRecords,
+		&i.ResourcesFound,
+		&i.StartedAt,
+		&i.CompletedAt,
+	)
+	return i, err
+}
+
 const getLatestSync = `-- name: GetLatestSync :one
 SELECT id, provider, account_id, region, period_start, period_end, cost_records, resources_found, started_at, completed_at FROM sync_history
 WHERE provider = ? AND account_id = ?